@@ -0,0 +1,348 @@
+#!/Users/nathan.norman/.pyenv/versions/3.10.14/bin/python3
+"""
+Lumber cut list and stock-length optimizer, driven by roof pitch.
+
+Expands the computed geometry into a framing member list per wing: studs
+and plates for the 30' back wall, the raked side wall (20' -> 12' over
+wall_x), the 12' interior wall back to the dome (t_hit long), rafters
+(rafter_len plus overhang, lapped over the interior wall) and the posts and
+beam at the 8' eave. The right_section extension past the interior wall is
+framed as an open porch under the roof, with no wall studs; the 3D model in
+hippie-hideout-mesh.py closes that side wall all the way to the post. Pieces
+are then packed into stock lengths: best-fit decreasing for every job, plus
+an optional exact branch-and-bound pass for lumber sizes with only a few
+pieces.
+
+Usage:
+    python3 hippie-hideout-cutlist.py --angle 25               # Print cut list
+    python3 hippie-hideout-cutlist.py --angle 25 --exact 14 --spacing 24
+    python3 hippie-hideout-cutlist.py --sweep 20 35 0.5        # Plot waste/cost vs pitch
+"""
+
+import argparse
+import importlib.util
+import math
+import os
+import time
+from collections import defaultdict
+
+import numpy as np
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location(
+    'hideout', os.path.join(_here, 'hippie-hideout-interactive.py'))
+hideout = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(hideout)
+
+# --- Framing assumptions ---
+PLATE_T = 1.5 / 12          # one 2x plate (feet)
+WALL_PLATES = 3             # bottom plate + double top plate
+RAFTER_OVERHANG = 2.0       # horizontal overhang past the post (same as the 3D model)
+RAFTER_LAP = 1.5            # horizontal overlap of upper and lower rafters over the interior wall
+POST_SPACING = 8.0          # max eave beam span between posts (feet)
+KERF = 0.125 / 12           # saw kerf (feet)
+CUT_ROUND = 0.125 / 12      # cut lengths rounded up to 1/8"
+
+WALL_SIZE = '2x6'
+RAFTER_SIZE = '2x10'
+BEAM_SIZE = '2x12'
+POST_SIZE = '6x6'
+
+# Stock lengths (feet) and price per linear foot for each size
+STOCK = {
+    '2x6': (8, 10, 12, 14, 16, 20),
+    '2x10': (10, 12, 14, 16, 20),
+    '2x12': (10, 12, 14, 16, 20),
+    '6x6': (8, 10, 12),
+}
+PRICE_PER_FT = {'2x6': 1.05, '2x10': 2.10, '2x12': 2.60, '6x6': 5.50}
+
+
+def _round_cut(length):
+    return math.ceil(length / CUT_ROUND - 1e-9) * CUT_ROUND
+
+
+def format_ft_in(length):
+    """12.2916 -> 12' 3-1/2" (nearest 1/8")."""
+    eighths = int(round(length * 96))
+    feet, eighths = divmod(eighths, 96)
+    inches, frac = divmod(eighths, 8)
+    if frac == 0:
+        return f"{feet}' {inches}\""
+    num, den = frac, 8
+    while num % 2 == 0:
+        num, den = num // 2, den // 2
+    return f"{feet}' {inches}-{num}/{den}\""
+
+
+def _member(wing, name, size, length, qty=1):
+    """One member line; runs longer than the longest stock are spliced into equal pieces."""
+    n = math.ceil(length / max(STOCK[size]) - 1e-9)
+    if n > 1:
+        name = f'{name} ({n}-pc splice)'
+    return (wing, name, size, _round_cut(length / n), qty * n)
+
+
+def _stud_positions(length, spacing_in):
+    """On-center stud positions along a wall (feet), always closing at the far end."""
+    x = np.arange(0, length, spacing_in / 12)
+    return np.append(x, length) if length - x[-1] > 1e-6 else x
+
+
+def _wall_members(wing, name, length, heights, spacing_in):
+    """Studs and plates for a wall whose top height varies linearly along it."""
+    x = _stud_positions(length, spacing_in)
+    h0, h1 = heights
+    studs = h0 + (h1 - h0) * x / length - WALL_PLATES * PLATE_T
+    members = [_member(wing, f'{name} stud', WALL_SIZE, s) for s in studs]
+
+    # Top plates follow the rake; the bottom plate is the plan length
+    members.append(_member(wing, f'{name} bottom plate', WALL_SIZE, length))
+    members.append(_member(wing, f'{name} top plate', WALL_SIZE,
+                           math.hypot(length, h1 - h0), WALL_PLATES - 1))
+    return members
+
+
+def member_list(g, stud_spacing=16, rafter_spacing=24):
+    """Full framing member list for both wings at the given geometry.
+
+    Returns a list of (wing, member, size, length_ft, qty).
+    """
+    fp = hideout.compute_floorplan(g)
+    tan_p = np.tan(g['pitch_rad'])
+    wall_x = g['wall_x']
+
+    right = []
+    right += _wall_members('right', 'back wall', hideout.BACK_WALL_LEN,
+                           (hideout.LEFT_WALL_H, hideout.LEFT_WALL_H), stud_spacing)
+    right += _wall_members('right', 'side wall', wall_x,
+                           (hideout.LEFT_WALL_H, hideout.LEFT_WALL_H - wall_x * tan_p),
+                           stud_spacing)
+    if fp['t_hit'] is not None:
+        right += _wall_members('right', 'interior wall', fp['t_hit'],
+                               (hideout.INTERIOR_WALL_H, hideout.INTERIOR_WALL_H),
+                               stud_spacing)
+
+    # Rafters are spaced along the back wall and lap over the 12' interior wall:
+    # upper run back wall -> interior wall, lower run interior wall -> eave,
+    # each running half the lap past the wall centre line
+    n_rafters = len(_stud_positions(hideout.BACK_WALL_LEN, rafter_spacing))
+    cos_p = np.cos(g['pitch_rad'])
+    half_lap = RAFTER_LAP / 2
+    right.append(_member('right', 'upper rafter', RAFTER_SIZE,
+                         (wall_x + half_lap) / cos_p, n_rafters))
+    right.append(_member('right', 'lower rafter', RAFTER_SIZE,
+                         (g['right_section'] + RAFTER_OVERHANG + half_lap) / cos_p,
+                         n_rafters))
+
+    # Eave beam (2-ply) on the post line, carried by evenly spaced 8' posts
+    # no more than POST_SPACING apart, one at each end
+    n_posts = math.ceil(hideout.BACK_WALL_LEN / POST_SPACING - 1e-9) + 1
+    right.append(_member('right', 'eave beam', BEAM_SIZE, hideout.BACK_WALL_LEN, 2))
+    right.append(_member('right', 'post', POST_SIZE, hideout.RIGHT_POST_H, n_posts))
+
+    left = [('left',) + m[1:] for m in right]
+    return right + left
+
+
+def _best_fit(pieces, stock):
+    """Best-fit decreasing into the longest stock, then shrink each board.
+
+    Returns a list of boards, each (stock_length, [piece lengths]).
+    """
+    cap = max(stock) + KERF
+    remaining = np.empty(len(pieces))
+    contents = []
+    for piece in sorted(pieces, reverse=True):
+        need = piece + KERF
+        n = len(contents)
+        fits = np.flatnonzero(remaining[:n] >= need - 1e-9)
+        if len(fits):
+            i = fits[np.argmin(remaining[fits])]
+        else:
+            i = n
+            contents.append([])
+            remaining[i] = cap
+        contents[i].append(piece)
+        remaining[i] -= need
+
+    stock_arr = np.array(sorted(stock))
+    boards = []
+    for cuts in contents:
+        used = sum(cuts) + KERF * (len(cuts) - 1)
+        boards.append((float(stock_arr[np.searchsorted(stock_arr, used - 1e-9)]), cuts))
+    return boards
+
+
+def _exact(pieces, stock, price, upper, max_nodes=200_000):
+    """Branch and bound: cheapest assignment of pieces to stock boards.
+
+    upper is a known solution (the heuristic); returns it if nothing cheaper
+    is found within max_nodes.
+    """
+    pieces = sorted(pieces, reverse=True)
+    stock = sorted(stock)
+    best = [sum(price * s for s, _ in upper), upper]
+    suffix = np.concatenate([np.cumsum(pieces[::-1])[::-1], [0.0]])
+    boards = []     # [stock, remaining, cuts]
+    nodes = [0]
+
+    def search(k, cost):
+        nodes[0] += 1
+        if nodes[0] > max_nodes:
+            return
+        spare = sum(b[1] for b in boards)
+        # Lower bound: every foot of uncut length beyond the spare must be bought
+        if cost + max(0.0, suffix[k] - spare) * price >= best[0] - 1e-9:
+            return
+        if k == len(pieces):
+            best[0] = cost
+            best[1] = [(b[0], list(b[2])) for b in boards]
+            return
+        piece = pieces[k]
+        tried = set()
+        for b in boards:
+            key = round(b[1], 6)
+            if b[1] >= piece + KERF - 1e-9 and key not in tried:
+                tried.add(key)
+                b[1] -= piece + KERF
+                b[2].append(piece)
+                search(k + 1, cost)
+                b[2].pop()
+                b[1] += piece + KERF
+        for s in stock:
+            if s >= piece - 1e-9:
+                boards.append([s, s - piece, [piece]])
+                search(k + 1, cost + price * s)
+                boards.pop()
+
+    search(0, 0.0)
+    return best[1]
+
+
+def optimize_cuts(members, exact_max=0):
+    """Pack members into stock lengths, per lumber size.
+
+    Sizes with at most exact_max pieces also get an exact pass. Returns
+    {size: {'boards': [(stock, cuts)], 'cost', 'waste', 'pieces'}}.
+    """
+    by_size = defaultdict(list)
+    for _, _, size, length, qty in members:
+        by_size[size].extend([length] * qty)
+
+    result = {}
+    for size, pieces in by_size.items():
+        boards = _best_fit(pieces, STOCK[size])
+        if len(pieces) <= exact_max:
+            boards = _exact(pieces, STOCK[size], PRICE_PER_FT[size], boards)
+        bought = sum(s for s, _ in boards)
+        result[size] = {
+            'boards': boards,
+            'cost': bought * PRICE_PER_FT[size],
+            'waste': bought - sum(pieces),
+            'bought': bought,
+            'pieces': len(pieces),
+        }
+    return result
+
+
+def cut_totals(result):
+    """(total cost, waste ft, waste fraction) across all sizes."""
+    cost = sum(r['cost'] for r in result.values())
+    waste = sum(r['waste'] for r in result.values())
+    bought = sum(r['bought'] for r in result.values())
+    return cost, waste, waste / bought if bought else 0.0
+
+
+def print_cut_list(angle_deg, stud_spacing=16, rafter_spacing=24, exact_max=0):
+    """Print the member list, the stock order and the cutting plan."""
+    g = hideout.compute_geometry(angle_deg)
+    members = member_list(g, stud_spacing, rafter_spacing)
+    result = optimize_cuts(members, exact_max)
+
+    print(f"=== CUT LIST — Roof Pitch {angle_deg:g}° ===")
+    print(f"Studs {stud_spacing}\" o.c., rafters {rafter_spacing}\" o.c.\n")
+    grouped = defaultdict(int)
+    for wing, member, size, length, qty in members:
+        grouped[(member, size, length)] += qty
+    width = max(len(member) for member, _, _ in grouped) + 2
+    print(f"{'Member':<{width}}{'Size':<7}{'Length':>12}{'Qty':>6}")
+    for (member, size, length), qty in sorted(grouped.items()):
+        print(f"{member:<{width}}{size:<7}{format_ft_in(length):>12}{qty:>6}")
+
+    print("\n=== STOCK ORDER ===")
+    for size, r in sorted(result.items()):
+        counts = defaultdict(int)
+        for s, _ in r['boards']:
+            counts[s] += 1
+        order = ', '.join(f"{n} x {s:g}'" for s, n in sorted(counts.items()))
+        print(f"{size:<6} {order:<44} waste {r['waste']:6.1f}'   ${r['cost']:8.2f}")
+
+    cost, waste, frac = cut_totals(result)
+    print(f"\nTotal: ${cost:.2f}   waste {waste:.1f}' ({frac:.1%})")
+
+    print("\n=== CUTTING PLAN ===")
+    for size, r in sorted(result.items()):
+        print(f"{size}:")
+        patterns = defaultdict(int)
+        for s, cuts in r['boards']:
+            patterns[(s, tuple(cuts))] += 1
+        for (s, cuts), n in sorted(patterns.items(), key=lambda p: (-p[0][0], -sum(p[0][1]))):
+            print(f"  {n:>3} x {s:g}': " + ' | '.join(format_ft_in(c) for c in cuts))
+
+
+def sweep(start, stop, step, stud_spacing=16, rafter_spacing=24, exact_max=0,
+          output_path=None):
+    """Plot lumber cost and waste against roof pitch."""
+    import matplotlib.pyplot as plt
+    import matplotlib.ticker as ticker
+
+    pitches = np.arange(start, stop + step / 2, step)
+    costs, wastes = [], []
+    t0 = time.perf_counter()
+    for p in pitches:
+        g = hideout.compute_geometry(p)
+        cost, waste, _ = cut_totals(optimize_cuts(member_list(g, stud_spacing, rafter_spacing),
+                                                  exact_max))
+        costs.append(cost)
+        wastes.append(waste)
+    ms = (time.perf_counter() - t0) * 1000.0 / len(pitches)
+
+    if output_path is None:
+        output_path = '/Users/nathan.norman/hippie-hideout-cutlist-sweep.png'
+    fig, ax_cost = plt.subplots(figsize=(12, 6))
+    ax_waste = ax_cost.twinx()
+    ax_cost.plot(pitches, costs, 'k-o', ms=3, lw=1.5, label='Lumber cost')
+    ax_waste.plot(pitches, wastes, '-s', color='brown', ms=3, lw=1.2, label='Waste')
+    ax_cost.set_xlabel("Roof Pitch (degrees)", fontsize=10)
+    ax_cost.set_ylabel("Lumber cost ($)", fontsize=10)
+    ax_waste.set_ylabel("Waste (linear feet)", fontsize=10, color='brown')
+    ax_cost.xaxis.set_major_locator(ticker.MultipleLocator(5))
+    ax_cost.xaxis.set_minor_locator(ticker.MultipleLocator(1))
+    ax_cost.grid(True, which='major', lw=0.5, alpha=0.3, color='#aaa')
+    ax_cost.set_title(f"Framing Lumber vs Roof Pitch — studs {stud_spacing}\" o.c., "
+                      f"rafters {rafter_spacing}\" o.c.", fontsize=13, fontweight='bold')
+    fig.legend(loc='upper right', bbox_to_anchor=(0.88, 0.88))
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=200, facecolor='white')
+    plt.close(fig)
+    print(f"Saved {len(pitches)}-pitch sweep ({ms:.1f} ms per pitch) to {output_path}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Framing cut list for the Hippie Hideout wings')
+    parser.add_argument('--angle', type=float, default=20.0, help='roof pitch in degrees')
+    parser.add_argument('--sweep', type=float, nargs=3, metavar=('START', 'STOP', 'STEP'),
+                        help='plot cost and waste over a pitch range')
+    parser.add_argument('--spacing', type=float, default=16, help='stud spacing, inches o.c.')
+    parser.add_argument('--rafter-spacing', type=float, default=24,
+                        help='rafter spacing, inches o.c.')
+    parser.add_argument('--exact', type=int, default=0, metavar='N',
+                        help='exact pass for sizes with at most N pieces')
+    parser.add_argument('--out', default=None, help='sweep plot path')
+    args = parser.parse_args()
+
+    if args.sweep:
+        sweep(*args.sweep, args.spacing, args.rafter_spacing, args.exact, args.out)
+    else:
+        print_cut_list(args.angle, args.spacing, args.rafter_spacing, args.exact)
@@ -0,0 +1,146 @@
+#!/Users/nathan.norman/.pyenv/versions/3.10.14/bin/python3
+"""
+Warm render daemon for repeated dual-view exports.
+
+Pays interpreter startup, numpy/matplotlib import and font loading once, then
+serves export requests over a Unix domain socket. A pool of forked worker
+processes each keeps its own figure alive and redraws it in place, so
+concurrent requests render in parallel without sharing matplotlib state.
+
+Protocol: one JSON object per line, one JSON reply per line.
+    -> {"angle": 25, "output": "/abs/path.png"}      (output optional)
+    <- {"ok": true, "path": "/abs/path.png", "ms": 42.0}
+    <- {"ok": false, "error": "..."}
+    -> {"ping": true}                                 (liveness check)
+    <- {"ok": true, "pong": true}
+
+Usage:
+    python3 hippie-hideout-daemon.py                  # Serve on the default socket
+    python3 hippie-hideout-daemon.py --workers 4
+    python3 hippie-hideout-render.py --angle 25       # Client, same args as interactive
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import time
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+_here = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load(name, filename):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_here, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+hideout = _load('hideout', 'hippie-hideout-interactive.py')
+client = _load('hideout_client', 'hippie-hideout-render.py')
+
+# Per-worker warm figure, set up by _init_worker
+_figure = None
+
+
+def _init_worker():
+    """Build the worker's figure and render it once to load fonts and caches.
+
+    This first render also lays the figure out; requests reuse that layout.
+    """
+    global _figure
+    # The parent handles shutdown; a worker killed while waiting for a task
+    # would hold the pool's queue lock and deadlock it
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    _figure = hideout.make_dual_figure()
+    hideout.render_dual(*_figure, 20.0, io.BytesIO())
+
+
+def _render(angle_deg, output_path):
+    start = time.perf_counter()
+    path = hideout.render_dual(*_figure, angle_deg, output_path, layout=False)
+    return path, (time.perf_counter() - start) * 1000.0
+
+
+class RenderHandler(socketserver.StreamRequestHandler):
+    """Read request lines and answer each with a JSON reply line."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if request.get('ping'):
+                    reply = {'ok': True, 'pong': True}
+                    self.wfile.write(json.dumps(reply).encode() + b'\n')
+                    self.wfile.flush()
+                    continue
+                angle = float(request['angle'])
+                output = request.get('output')
+                path, ms = self.server.pool.apply(_render, (angle, output))
+                reply = {'ok': True, 'path': path, 'ms': ms}
+            except Exception as exc:
+                reply = {'ok': False, 'error': f'{type(exc).__name__}: {exc}'}
+            self.wfile.write(json.dumps(reply).encode() + b'\n')
+            self.wfile.flush()
+
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, pool):
+        self.pool = pool
+        super().__init__(socket_path, RenderHandler)
+
+
+def serve(socket_path=None, workers=None):
+    """Start the worker pool and serve requests until interrupted."""
+    socket_path = socket_path or client.default_socket_path()
+    workers = workers or min(4, os.cpu_count() or 1)
+
+    if os.path.exists(socket_path):
+        try:
+            alive = client.ping(socket_path)
+        except socket.timeout:
+            raise SystemExit(f"A render daemon on {socket_path} is not responding")
+        if alive:
+            raise SystemExit(f"A render daemon is already listening on {socket_path}")
+        if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            raise SystemExit(f"{socket_path} exists and is not a socket; not removing it")
+        os.unlink(socket_path)  # stale socket from a dead daemon
+
+    # Fork before any server threads exist; workers inherit the loaded modules
+    ctx = multiprocessing.get_context('fork')
+    pool = ctx.Pool(workers, initializer=_init_worker)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        with RenderServer(socket_path, pool) as server:
+            print(f"Render daemon: {workers} workers on {socket_path}")
+            try:
+                server.serve_forever()
+            except (KeyboardInterrupt, SystemExit):
+                pass
+            finally:
+                os.unlink(socket_path)
+    finally:
+        # Workers ignore SIGTERM, so let them finish and exit rather than
+        # Pool.terminate()
+        pool.close()
+        pool.join()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Warm render daemon for Hippie Hideout exports')
+    parser.add_argument('--socket', default=None, help='Unix socket path')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes')
+    args = parser.parse_args()
+    serve(args.socket, args.workers)
@@ -0,0 +1,260 @@
+#!/Users/nathan.norman/.pyenv/versions/3.10.14/bin/python3
+"""
+Printable hidden-line elevations from any compass angle.
+
+Python counterpart of view-elevations.html. The building comes from
+hippie-hideout-mesh.py (same parts as the 3D export). For each view the
+feature edges (outlines, creases, silhouettes) are split into short samples,
+and every sample is tested against every front-facing triangle at once with
+NumPy broadcasting; a sample is hidden when it projects strictly inside a
+triangle that is nearer to the viewer.
+
+Angle convention matches view-elevations.html: 0°=S, 90°=E, 180°=N, 270°=W,
+    screen_x = wx*cos(a) + wy*sin(a)
+    depth    = -wx*sin(a) + wy*cos(a)     (positive = further from viewer)
+
+Usage:
+    python3 hippie-hideout-elevations.py --angle 25                  # 8 elevations, one PDF
+    python3 hippie-hideout-elevations.py --sweep 20 35 5 --out permit-elevations.pdf
+    python3 hippie-hideout-elevations.py --angle 25 --views 0 90 --format png --hidden
+"""
+
+import argparse
+import importlib.util
+import os
+
+import numpy as np
+import matplotlib.ticker as ticker
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import PdfPages
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location(
+    'hideout_mesh', os.path.join(_here, 'hippie-hideout-mesh.py'))
+mesh = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mesh)
+hideout = mesh.hideout
+
+COMPASS_8 = (0, 45, 90, 135, 180, 225, 270, 315)
+COMPASS_LABELS = ['S', 'SSE', 'SE', 'ESE', 'E', 'ENE', 'NE', 'NNE',
+                  'N', 'NNW', 'NW', 'WNW', 'W', 'WSW', 'SW', 'SSW']
+
+CREASE_DEG = 20.0      # dihedral angle above which an edge is drawn
+SAMPLE_STEP = 0.25     # feet between visibility samples along an edge
+DEPTH_EPS = 0.05       # feet; a face must be this much nearer to hide a sample
+INSIDE_EPS = 1e-3      # barycentric margin; samples on a face's edge stay visible
+CHUNK = 1 << 20        # max sample x triangle pairs per broadcast
+
+
+def compass_label(view_deg):
+    """Compass name for a view angle (0°=S, clockwise), as in view-elevations.html."""
+    return COMPASS_LABELS[int(round((view_deg % 360) / 22.5)) % 16]
+
+
+def _project(points, view_deg):
+    """World (x, y, z) -> (screen_x, screen_y, depth)."""
+    a = np.radians(view_deg)
+    c, s = np.cos(a), np.sin(a)
+    x, y, z = points[..., 0], points[..., 1], points[..., 2]
+    return np.stack([x * c + y * s, z, -x * s + y * c], axis=-1)
+
+
+def feature_edges(verts, faces, view_deg, crease_deg=CREASE_DEG):
+    """Edges worth drawing from this view, as an (E, 2, 3) world-space array.
+
+    Keeps boundary edges, creases sharper than crease_deg with at least one
+    front-facing side, and silhouette edges between a front- and back-facing
+    triangle. Flat-shaded diagonals and smooth dome seams drop out.
+    """
+    tri = verts[faces].astype(float)
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+    a = np.radians(view_deg)
+    facing = normals @ np.array([-np.sin(a), np.cos(a), 0.0]) < 0
+
+    edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    owner = np.tile(np.arange(len(faces)), 3)
+    edges = np.sort(edges, axis=1)
+    order = np.lexsort((edges[:, 1], edges[:, 0]))
+    edges, owner = edges[order], owner[order]
+
+    shared = np.all(edges[1:] == edges[:-1], axis=1)
+    first = np.flatnonzero(shared)
+    f1, f2 = owner[first], owner[first + 1]
+    crease = np.einsum('ij,ij->i', normals[f1], normals[f2]) < np.cos(np.radians(crease_deg))
+    keep_pair = ((crease & (facing[f1] | facing[f2])) | (facing[f1] != facing[f2]))
+
+    paired = np.zeros(len(edges), bool)
+    paired[first] = paired[first + 1] = True
+    boundary = ~paired
+
+    drawn = np.concatenate([edges[first[keep_pair]], edges[boundary]])
+    return verts[drawn].astype(float)
+
+
+def hidden_line(parts, view_deg, step=SAMPLE_STEP):
+    """Split every part's feature edges into visible and hidden 2D segments.
+
+    Returns (visible, hidden), each an (N, 2, 2) array of screen-space
+    segments in feet. All parts occlude one another.
+    """
+    edge_list, occluders = [], []
+    a = np.radians(view_deg)
+    view_dir = np.array([-np.sin(a), np.cos(a), 0.0])
+    for verts, faces in parts.values():
+        edge_list.append(feature_edges(verts, faces, view_deg))
+        tri = verts[faces].astype(float)
+        n = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        occluders.append(tri[n @ view_dir < 0])  # back faces never occlude first
+    edges = _project(np.concatenate(edge_list), view_deg)
+    tris = _project(np.concatenate(occluders), view_deg)
+
+    # Sub-segment every edge; visibility is decided at each sub-segment's midpoint
+    lengths = np.linalg.norm(edges[:, 1, :2] - edges[:, 0, :2], axis=1)
+    n_sub = np.maximum(1, np.ceil(lengths / step).astype(int))
+    edge_id = np.repeat(np.arange(len(edges)), n_sub)
+    k = np.arange(n_sub.sum()) - np.repeat(np.cumsum(n_sub) - n_sub, n_sub)
+    t0 = (k / n_sub[edge_id])[:, None]
+    t1 = ((k + 1) / n_sub[edge_id])[:, None]
+    p0, p1 = edges[edge_id, 0], edges[edge_id, 1]
+    seg_start = p0 + (p1 - p0) * t0
+    seg_end = p0 + (p1 - p0) * t1
+    mid = (seg_start + seg_end) / 2
+
+    # Per-triangle barycentric setup in screen space; drop edge-on triangles
+    x0, y0, d0 = tris[:, 0].T
+    x1, y1, d1 = tris[:, 1].T
+    x2, y2, d2 = tris[:, 2].T
+    denom = (y1 - y2) * (x0 - x2) + (x2 - x1) * (y0 - y2)
+    ok = np.abs(denom) > 1e-9
+    x0, y0, d0, x1, y1, d1, x2, y2, d2, denom = (
+        v[ok] for v in (x0, y0, d0, x1, y1, d1, x2, y2, d2, denom))
+    lo = np.minimum(np.minimum(x0, x1), x2)
+    hi = np.maximum(np.maximum(x0, x1), x2)
+
+    occluded = np.zeros(len(mid), bool)
+    rows = max(1, CHUNK // max(1, len(denom)))
+    for s in range(0, len(mid), rows):
+        px = mid[s:s + rows, 0:1]
+        py = mid[s:s + rows, 1:2]
+        pd = mid[s:s + rows, 2:3]
+        l0 = ((y1 - y2) * (px - x2) + (x2 - x1) * (py - y2)) / denom
+        l1 = ((y2 - y0) * (px - x2) + (x0 - x2) * (py - y2)) / denom
+        l2 = 1.0 - l0 - l1
+        inside = ((px > lo) & (px < hi) &
+                  (l0 > INSIDE_EPS) & (l1 > INSIDE_EPS) & (l2 > INSIDE_EPS))
+        face_d = l0 * d0 + l1 * d1 + l2 * d2
+        occluded[s:s + rows] = np.any(inside & (face_d < pd - DEPTH_EPS), axis=1)
+
+    # Flip lone samples that disagree with both neighbours on the same edge;
+    # these are depth ties where an edge lies on a face, not real breaks
+    same = (edge_id[1:-1] == edge_id[:-2]) & (edge_id[1:-1] == edge_id[2:])
+    lone = same & (occluded[:-2] == occluded[2:]) & (occluded[1:-1] != occluded[:-2])
+    occluded[1:-1][lone] = occluded[:-2][lone]
+
+    segs = np.stack([seg_start[:, :2], seg_end[:, :2]], axis=1)
+    return segs[~occluded], segs[occluded]
+
+
+def elevation_lines(pitches, views=COMPASS_8):
+    """Hidden-line segments for every (pitch, view) pair in one call.
+
+    Meshes are built once per pitch (pitch-independent parts come from the
+    mesh cache). Returns {(pitch, view): (visible, hidden)}.
+    """
+    out = {}
+    for pitch in pitches:
+        parts = mesh.build_parts(pitch)
+        for view in views:
+            out[(pitch, view)] = hidden_line(parts, view)
+    return out
+
+
+def draw_elevation(ax, visible, hidden, pitch_deg, view_deg, reach, show_hidden=False):
+    """Draw one elevation's line work on the given axes.
+
+    reach is the half-width in feet to frame; pass the same value for every
+    sheet in a set so they all print at one scale.
+    """
+    ax.clear()
+
+    ax.plot([-reach - 3, reach + 3], [0, 0], color='#8B7355', lw=2)
+    if show_hidden and len(hidden):
+        ax.add_collection(LineCollection(hidden, colors='#999', linewidths=0.6,
+                                         linestyles=(0, (3, 2))))
+    ax.add_collection(LineCollection(visible, colors='k', linewidths=1.4,
+                                     capstyle='round'))
+
+    ax.set_xlim(-reach - 4, reach + 4)
+    ax.set_ylim(-3, hideout.RIGHT_POST_H + hideout.DOME_R + 4)
+    ax.set_aspect('equal')
+    ax.grid(True, which='major', lw=0.5, alpha=0.3, color='#aaa')
+    ax.grid(True, which='minor', lw=0.2, alpha=0.15, color='#ccc')
+    ax.xaxis.set_major_locator(ticker.MultipleLocator(5))
+    ax.yaxis.set_major_locator(ticker.MultipleLocator(5))
+    ax.xaxis.set_minor_locator(ticker.MultipleLocator(1))
+    ax.yaxis.set_minor_locator(ticker.MultipleLocator(1))
+    ax.set_xlabel("Feet", fontsize=10)
+    ax.set_ylabel("Feet", fontsize=10)
+    ax.set_title(f"Elevation — {compass_label(view_deg)} ({view_deg:.0f}°)    "
+                 f"Roof Pitch {pitch_deg:g}°", fontsize=13, fontweight='bold')
+
+
+def export_elevations(pitches, views=COMPASS_8, output_path=None, fmt='pdf',
+                      dpi=300, show_hidden=False):
+    """Render every elevation for every pitch: one PDF page or PNG per elevation."""
+    if output_path is None:
+        output_path = '/Users/nathan.norman/hippie-hideout-elevations'
+    output_path = os.path.splitext(output_path)[0]
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    lines = elevation_lines(pitches, views)
+    reach = max(float(np.abs(seg[..., 0]).max())
+                for pair in lines.values() for seg in pair if len(seg))
+
+    def pages():
+        for (pitch, view), (visible, hidden) in lines.items():
+            fig = Figure(figsize=(17, 11))
+            fig.patch.set_facecolor('white')
+            ax = fig.add_subplot()
+            draw_elevation(ax, visible, hidden, pitch, view, reach, show_hidden)
+            fig.tight_layout()
+            yield pitch, view, fig
+
+    written = []
+    if fmt == 'pdf':
+        path = f'{output_path}.pdf'
+        with PdfPages(path) as pdf:
+            for _, _, fig in pages():
+                pdf.savefig(fig, facecolor='white')
+        written.append(path)
+    else:
+        for pitch, view, fig in pages():
+            path = f'{output_path}-{pitch:g}deg-{compass_label(view)}.png'
+            fig.savefig(path, dpi=dpi, facecolor='white')
+            written.append(path)
+
+    print(f"Saved {len(lines)} elevations ({len(pitches)} pitches x {len(views)} views) "
+          f"to {', '.join(written) if len(written) < 4 else os.path.dirname(os.path.abspath(written[0]))}")
+    return written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Hidden-line elevations of the Hippie Hideout')
+    parser.add_argument('--angle', type=float, default=20.0, help='roof pitch in degrees')
+    parser.add_argument('--sweep', type=float, nargs=3, metavar=('START', 'STOP', 'STEP'),
+                        help='roof pitch sweep instead of a single --angle')
+    parser.add_argument('--views', type=float, nargs='+', default=list(COMPASS_8),
+                        help='view angles, 0=S 90=E 180=N 270=W (default: 8 compass points)')
+    parser.add_argument('--out', default=None, help='output path (no extension)')
+    parser.add_argument('--format', choices=['pdf', 'png'], default='pdf')
+    parser.add_argument('--dpi', type=int, default=300, help='PNG resolution')
+    parser.add_argument('--hidden', action='store_true', help='draw hidden lines dashed')
+    args = parser.parse_args()
+
+    if args.sweep:
+        start, stop, step = args.sweep
+        pitches = [float(p) for p in np.arange(start, stop + step / 2, step)]
+    else:
+        pitches = [args.angle]
+    export_elevations(pitches, args.views, args.out, args.format, args.dpi, args.hidden)
@@ -5,6 +5,7 @@ Interactive dual-view: cross-section + floor plan, driven by roof pitch slider.
 Usage:
     python3 shed-crosssection-interactive.py              # Opens interactive slider window
     python3 shed-crosssection-interactive.py --angle 25   # Exports single PNG at 25°
+    python3 shed-crosssection-interactive.py --angle 25 --out plan.png
 """
 
 import sys
@@ -22,6 +23,10 @@ DOME_R = 16.5          # dome radius
 CONN_ANGLE = 20.0      # degrees above horizontal where wings attach
 WALL_ANGLE_DEG = -25.0 # degrees below horizontal for the 30' back wall
 
+# --- Interactive redraw timing ---
+DRAFT_MS = 16          # min interval between draft redraws while dragging
+SETTLE_MS = 250        # slider idle time before the full-quality redraw
+
 
 def compute_geometry(pitch_deg):
     """Compute all derived dimensions from roof pitch angle."""
@@ -40,8 +45,36 @@ def compute_geometry(pitch_deg):
     }
 
 
-def draw_cross_section(ax, g):
-    """Draw the cross-section (side view) on the given axes."""
+def setup_axes(ax, xlim, ylim, title, draft=False):
+    """Fixed limits, grid and labels shared by both views.
+
+    Drafts skip the minor ticks and grid, which cost about as much to draw
+    as everything else on the axes.
+    """
+    ax.set_aspect('equal')
+    ax.set_xlim(*xlim)
+    ax.set_ylim(*ylim)
+    ax.grid(True, which='major', lw=0.5, alpha=0.3, color='#aaa')
+    ax.xaxis.set_major_locator(ticker.MultipleLocator(5))
+    ax.yaxis.set_major_locator(ticker.MultipleLocator(5))
+    if draft:
+        ax.xaxis.set_minor_locator(ticker.NullLocator())
+        ax.yaxis.set_minor_locator(ticker.NullLocator())
+    else:
+        ax.grid(True, which='minor', lw=0.2, alpha=0.15, color='#ccc')
+        ax.xaxis.set_minor_locator(ticker.MultipleLocator(1))
+        ax.yaxis.set_minor_locator(ticker.MultipleLocator(1))
+    ax.set_xlabel("Feet", fontsize=10)
+    ax.set_ylabel("Feet", fontsize=10)
+    ax.set_title(title, fontsize=13, fontweight='bold')
+
+
+def draw_cross_section(ax, g, draft=False):
+    """Draw the cross-section (side view) on the given axes.
+
+    With draft=True only the structure lines are drawn (no joint marks,
+    dimensions or labels), for cheap redraws while the slider is dragged.
+    """
     ax.clear()
 
     pitch_deg = g['pitch_deg']
@@ -51,12 +84,19 @@ def draw_cross_section(ax, g):
     rafter_len = g['rafter_len']
     right_section = g['right_section']
 
+    # Fixed axes so view doesn't jump
+    max_span = ROOF_DROP / np.tan(np.radians(20))
+    setup_axes(ax, (-3, max_span + 4), (-4.5, LEFT_WALL_H + 2),
+               "Cross-Section (Side View)", draft)
+
     # Structure lines
     ax.plot([0, horiz_span], [0, 0], 'k-', lw=2.5)
     ax.plot([0, 0], [0, LEFT_WALL_H], 'k-', lw=2.5)
     ax.plot([horiz_span, horiz_span], [0, RIGHT_POST_H], 'k-', lw=2.5)
     ax.plot([0, horiz_span], [LEFT_WALL_H, RIGHT_POST_H], 'k-', lw=2.5)
     ax.plot([wall_x, wall_x], [0, INTERIOR_WALL_H], 'k-', lw=2)
+    if draft:
+        return
 
     # X marks at joints
     ms = 0.5
@@ -123,60 +163,26 @@ def draw_cross_section(ax, g):
     ax.annotate("WALL", xy=(wall_x + 0.8, INTERIOR_WALL_H + 0.5), fontsize=10,
                 fontweight='bold', ha='left')
 
-    # Fixed axes so view doesn't jump
-    max_span = ROOF_DROP / np.tan(np.radians(20))
-    ax.set_xlim(-3, max_span + 4)
-    ax.set_ylim(-4.5, LEFT_WALL_H + 2)
-    ax.set_aspect('equal')
-    ax.grid(True, which='major', lw=0.5, alpha=0.3, color='#aaa')
-    ax.grid(True, which='minor', lw=0.2, alpha=0.15, color='#ccc')
-    ax.xaxis.set_major_locator(ticker.MultipleLocator(5))
-    ax.yaxis.set_major_locator(ticker.MultipleLocator(5))
-    ax.xaxis.set_minor_locator(ticker.MultipleLocator(1))
-    ax.yaxis.set_minor_locator(ticker.MultipleLocator(1))
-    ax.set_xlabel("Feet", fontsize=10)
-    ax.set_ylabel("Feet", fontsize=10)
-    ax.set_title("Cross-Section (Side View)", fontsize=13, fontweight='bold')
-
-
-def draw_floorplan(ax, g):
-    """Draw the top-down floor plan on the given axes, with wing dimensions from geometry."""
-    ax.clear()
 
-    wall_x = g['wall_x']          # was 22' at 20° pitch
-    right_section = g['right_section']  # was 11' at 20° pitch
-    pitch_deg = g['pitch_deg']
+def compute_floorplan(g):
+    """Compute the plan-view points of both wings and the entry (feet, dome at origin).
 
+    Left-wing points are the right-wing points mirrored across the y-axis.
+    'wall3_end' and 't_hit' are None when the return wall misses the dome.
+    """
     r = DOME_R
+    wall_x = g['wall_x']
+    right_section = g['right_section']
     wall_angle = np.radians(WALL_ANGLE_DEG)
     conn_rad = np.radians(CONN_ANGLE)
 
-    # --- DOME ---
-    theta = np.linspace(0, 2 * np.pi, 500)
-    ax.plot(r * np.cos(theta), r * np.sin(theta), 'k-', lw=2)
-    ax.text(0, 0, 'B', fontsize=16, fontweight='bold', ha='center', va='center', color='#333')
-
-    # --- RIGHT WING ---
-    # Connection point
+    # Right wing: connection point, 30' back wall, wing wall + extension to post
     P = r * np.array([np.cos(conn_rad), np.sin(conn_rad)])
-    ax.plot(*P, 'ko', ms=6, zorder=5)
-
-    # 30' back wall at angle
     wall_end = P + BACK_WALL_LEN * np.array([np.cos(wall_angle), np.sin(wall_angle)])
-    ax.plot([P[0], wall_end[0]], [P[1], wall_end[1]], 'k-', lw=2)
-
-    # Wing wall (was 22', now = wall_x) perpendicular to back wall
     wall2_angle = wall_angle - np.pi / 2
     wall2_dir = np.array([np.cos(wall2_angle), np.sin(wall2_angle)])
     wall2_end = wall_end + wall_x * wall2_dir
-    ax.plot([wall_end[0], wall2_end[0]], [wall_end[1], wall2_end[1]], 'k-', lw=2)
-    ax.plot(*wall_end, 'ko', ms=5, zorder=5)
-
-    # Extension to post (was 11', now = right_section)
     post_end = wall2_end + right_section * wall2_dir
-    ax.plot([wall2_end[0], post_end[0]], [wall2_end[1], post_end[1]], 'k-', lw=2)
-    ax.plot(*post_end, 'ks', ms=8, zorder=5)
-    ax.plot(*wall2_end, 'ko', ms=5, zorder=5)
 
     # Wall back to dome from wall2_end
     wall3_angle = wall2_angle - np.pi / 2
@@ -185,11 +191,117 @@ def draw_floorplan(ax, g):
     b_coef = 2 * np.dot(wall2_end, wall3_dir)
     c_coef = np.dot(wall2_end, wall2_end) - r**2
     disc = b_coef**2 - 4 * a_coef * c_coef
+    t_hit = wall3_end = None
     if disc >= 0:
         t_hit = (-b_coef - np.sqrt(disc)) / (2 * a_coef)
         wall3_end = wall2_end + t_hit * wall3_dir
-        ax.plot([wall2_end[0], wall3_end[0]], [wall2_end[1], wall3_end[1]], 'k-', lw=2)
+
+    # Front entry rectangle
+    half_width = 4.0
+    y_int = -np.sqrt(r**2 - half_width**2)
+    left_int = np.array([-half_width, y_int])
+    right_int = np.array([half_width, y_int])
+    left_bot = left_int + np.array([0, -5])
+    right_bot = right_int + np.array([0, -5])
+
+    return {
+        'P': P,
+        'wall_end': wall_end,
+        'wall2_end': wall2_end,
+        'post_end': post_end,
+        'wall3_end': wall3_end,
+        't_hit': t_hit,
+        'wall_angle': wall_angle,
+        'wall2_angle': wall2_angle,
+        'wall3_angle': wall3_angle,
+        'wall2_dir': wall2_dir,
+        'entry': (left_int, right_int, right_bot, left_bot),
+    }
+
+
+def draw_floorplan(ax, g, draft=False):
+    """Draw the top-down floor plan on the given axes, with wing dimensions from geometry.
+
+    With draft=True only the wall lines and coarse dome/front arcs are drawn
+    (no markers, dimensions or labels), for cheap redraws while dragging.
+    """
+    ax.clear()
+
+    wall_x = g['wall_x']          # was 22' at 20° pitch
+    right_section = g['right_section']  # was 11' at 20° pitch
+    pitch_deg = g['pitch_deg']
+
+    r = DOME_R
+    fp = compute_floorplan(g)
+    wall_angle = fp['wall_angle']
+    wall2_angle = fp['wall2_angle']
+    wall3_angle = fp['wall3_angle']
+    P = fp['P']
+    wall_end = fp['wall_end']
+    wall2_end = fp['wall2_end']
+    post_end = fp['post_end']
+    wall3_end = fp['wall3_end']
+    t_hit = fp['t_hit']
+    hits_dome = wall3_end is not None
+
+    # --- LEFT WING (mirror) ---
+    def mirror(pt):
+        return np.array([-pt[0], pt[1]])
+
+    P_L = mirror(P)
+    wall_end_L = mirror(wall_end)
+    wall2_end_L = mirror(wall2_end)
+    post_end_L = mirror(post_end)
+    wall3_end_L = mirror(wall3_end) if hits_dome else None
+
+    setup_axes(ax, (-52, 52), (-42, 22), "Floor Plan (Top Down)", draft)
+
+    # --- DOME ---
+    theta = np.linspace(0, 2 * np.pi, 72 if draft else 500)
+    ax.plot(r * np.cos(theta), r * np.sin(theta), 'k-', lw=2)
+
+    # --- Wing walls: back wall, wing wall (wall_x), extension to post
+    # (right_section), and the wall back to the dome from wall2_end ---
+    for p0, p1, p2, p3, p4 in [(P, wall_end, wall2_end, post_end, wall3_end),
+                               (P_L, wall_end_L, wall2_end_L, post_end_L, wall3_end_L)]:
+        ax.plot([p0[0], p1[0]], [p0[1], p1[1]], 'k-', lw=2)
+        ax.plot([p1[0], p2[0]], [p1[1], p2[1]], 'k-', lw=2)
+        ax.plot([p2[0], p3[0]], [p2[1], p3[1]], 'k-', lw=2)
+        if hits_dome:
+            ax.plot([p2[0], p4[0]], [p2[1], p4[1]], 'k-', lw=2)
+
+    # --- Front rectangle + arc ---
+    left_int, right_int, right_bot, left_bot = fp['entry']
+    ax.plot([left_int[0], right_int[0]], [left_int[1], right_int[1]], 'k-', lw=2)
+    ax.plot([left_int[0], left_bot[0]], [left_int[1], left_bot[1]], 'k-', lw=2)
+    ax.plot([right_int[0], right_bot[0]], [right_int[1], right_bot[1]], 'k-', lw=2)
+    ax.plot([left_bot[0], right_bot[0]], [left_bot[1], right_bot[1]], 'k-', lw=2)
+
+    # Front arc
+    bot_y = left_bot[1]
+    px, py = post_end[0], post_end[1]
+    arc_cy = (px**2 + py**2 - bot_y**2) / (2 * (py - bot_y))
+    arc_R = abs(arc_cy - bot_y)
+    a_right = np.arctan2(post_end[1] - arc_cy, post_end[0])
+    a_left = np.arctan2(post_end_L[1] - arc_cy, post_end_L[0])
+    arc_th = np.linspace(a_right, a_left, 40 if draft else 200)
+    ax.plot(arc_R * np.cos(arc_th), arc_cy + arc_R * np.sin(arc_th), 'k-', lw=1.5, alpha=0.5)
+
+    if draft:
+        return
+
+    # --- Joint markers ---
+    for pt in (P, P_L, left_int, right_int):
+        ax.plot(*pt, 'ko', ms=6, zorder=5)
+    for pt in (wall_end, wall2_end, wall_end_L, wall2_end_L):
+        ax.plot(*pt, 'ko', ms=5, zorder=5)
+    for pt in (post_end, post_end_L):
+        ax.plot(*pt, 'ks', ms=8, zorder=5)
+    if hits_dome:
         ax.plot(*wall3_end, 'ko', ms=5, zorder=5)
+        ax.plot(*wall3_end_L, 'ko', ms=5, zorder=5)
+
+    ax.text(0, 0, 'B', fontsize=16, fontweight='bold', ha='center', va='center', color='#333')
 
     # --- Dimension labels (right wing) ---
     perp = np.array([np.sin(wall_angle), -np.cos(wall_angle)])
@@ -212,37 +324,13 @@ def draw_floorplan(ax, g):
     ax.text(post_end[0] - 1.5, post_end[1] - 1.5, f"Post (8')", fontsize=9,
             fontweight='bold', ha='center', color='#333')
 
-    if disc >= 0:
+    if hits_dome:
         perp3 = np.array([np.sin(wall3_angle), -np.cos(wall3_angle)])
         wall3_mid = (wall2_end + wall3_end) / 2
         ax.text(*(wall3_mid + 2 * perp3), f"{t_hit:.1f}'", fontsize=11, fontweight='bold',
                 color='#333', ha='center', va='center',
                 rotation=np.degrees(wall3_angle) + 180)
 
-    # --- LEFT WING (mirror) ---
-    def mirror(pt):
-        return np.array([-pt[0], pt[1]])
-
-    P_L = mirror(P)
-    ax.plot(*P_L, 'ko', ms=6, zorder=5)
-
-    wall_end_L = mirror(wall_end)
-    ax.plot([P_L[0], wall_end_L[0]], [P_L[1], wall_end_L[1]], 'k-', lw=2)
-
-    wall2_end_L = mirror(wall2_end)
-    ax.plot([wall_end_L[0], wall2_end_L[0]], [wall_end_L[1], wall2_end_L[1]], 'k-', lw=2)
-    ax.plot(*wall_end_L, 'ko', ms=5, zorder=5)
-
-    post_end_L = mirror(post_end)
-    ax.plot([wall2_end_L[0], post_end_L[0]], [wall2_end_L[1], post_end_L[1]], 'k-', lw=2)
-    ax.plot(*post_end_L, 'ks', ms=8, zorder=5)
-    ax.plot(*wall2_end_L, 'ko', ms=5, zorder=5)
-
-    if disc >= 0:
-        wall3_end_L = mirror(wall3_end)
-        ax.plot([wall2_end_L[0], wall3_end_L[0]], [wall2_end_L[1], wall3_end_L[1]], 'k-', lw=2)
-        ax.plot(*wall3_end_L, 'ko', ms=5, zorder=5)
-
     # Left wing labels
     wall_mid_L = (P_L + wall_end_L) / 2
     ax.text(*(wall_mid_L - 1.5 * perp), f"30'", fontsize=11, fontweight='bold',
@@ -261,63 +349,37 @@ def draw_floorplan(ax, g):
     ax.text(post_end_L[0] + 1.5, post_end_L[1] - 1.5, f"Post (8')", fontsize=9,
             fontweight='bold', ha='center', color='#333')
 
-    if disc >= 0:
+    if hits_dome:
         wall3_mid_L = (wall2_end_L + wall3_end_L) / 2
         ax.text(*(wall3_mid_L - 2 * perp3), f"{t_hit:.1f}'", fontsize=11, fontweight='bold',
                 color='#333', ha='center', va='center',
                 rotation=-np.degrees(wall3_angle) + 180)
 
-    # --- Front rectangle + arc ---
-    half_width = 4.0
-    y_int = -np.sqrt(r**2 - half_width**2)
-    left_int = np.array([-half_width, y_int])
-    right_int = np.array([half_width, y_int])
-    ax.plot([left_int[0], right_int[0]], [left_int[1], right_int[1]], 'k-', lw=2)
-    ax.plot(*left_int, 'ko', ms=6, zorder=5)
-    ax.plot(*right_int, 'ko', ms=6, zorder=5)
-
-    left_bot = left_int + np.array([0, -5])
-    right_bot = right_int + np.array([0, -5])
-    ax.plot([left_int[0], left_bot[0]], [left_int[1], left_bot[1]], 'k-', lw=2)
-    ax.plot([right_int[0], right_bot[0]], [right_int[1], right_bot[1]], 'k-', lw=2)
-    ax.plot([left_bot[0], right_bot[0]], [left_bot[1], right_bot[1]], 'k-', lw=2)
-
-    # Front arc
-    bot_y = left_bot[1]
-    px, py = post_end[0], post_end[1]
-    arc_cy = (px**2 + py**2 - bot_y**2) / (2 * (py - bot_y))
-    arc_R = abs(arc_cy - bot_y)
-    a_right = np.arctan2(post_end[1] - arc_cy, post_end[0])
-    a_left = np.arctan2(post_end_L[1] - arc_cy, post_end_L[0])
-    arc_th = np.linspace(a_right, a_left, 200)
-    ax.plot(arc_R * np.cos(arc_th), arc_cy + arc_R * np.sin(arc_th), 'k-', lw=1.5, alpha=0.5)
-
-    # --- Grid ---
-    ax.set_aspect('equal')
-    ax.set_xlim(-52, 52)
-    ax.set_ylim(-42, 22)
-    ax.grid(True, which='major', lw=0.5, alpha=0.3, color='#aaa')
-    ax.grid(True, which='minor', lw=0.2, alpha=0.15, color='#ccc')
-    ax.xaxis.set_major_locator(ticker.MultipleLocator(5))
-    ax.yaxis.set_major_locator(ticker.MultipleLocator(5))
-    ax.xaxis.set_minor_locator(ticker.MultipleLocator(1))
-    ax.yaxis.set_minor_locator(ticker.MultipleLocator(1))
-    ax.set_xlabel("Feet", fontsize=10)
-    ax.set_ylabel("Feet", fontsize=10)
-    ax.set_title("Floor Plan (Top Down)", fontsize=13, fontweight='bold')
-
 
 def run_interactive():
-    """Open interactive window with both views and a roof pitch slider."""
+    """Open interactive window with both views and a roof pitch slider.
+
+    Slider changes are drawn progressively: a draft (structure lines only)
+    at most once per DRAFT_MS while the slider moves, then the full-quality
+    views once it has been still for SETTLE_MS. Slider events that arrive
+    between drafts are coalesced, so only the latest pitch is ever drawn.
+    """
     from matplotlib.widgets import Slider
 
     fig, (ax_cross, ax_floor) = plt.subplots(1, 2, figsize=(22, 10))
     plt.subplots_adjust(bottom=0.12, wspace=0.25)
 
+    def set_title(g):
+        fig.suptitle(f"Hippie Hideout — Roof Pitch {g['pitch_deg']:.0f}°    |    "
+                     f"Wing room: {g['wall_x']:.1f}'    Post extension: {g['right_section']:.1f}'    "
+                     f"Total span: {g['horiz_span']:.1f}'",
+                     fontsize=13, fontweight='bold', y=0.98)
+
     # Initial draw at 20°
     g = compute_geometry(20.0)
     draw_cross_section(ax_cross, g)
     draw_floorplan(ax_floor, g)
+    set_title(g)
 
     # Slider
     ax_slider = fig.add_axes([0.15, 0.02, 0.7, 0.03])
@@ -325,34 +387,71 @@ def run_interactive():
                     color='steelblue')
     ax_slider.set_xlabel('degrees', fontsize=10)
 
-    def update(_):
-        g = compute_geometry(slider.val)
-        draw_cross_section(ax_cross, g)
-        draw_floorplan(ax_floor, g)
-        fig.suptitle(f"Hippie Hideout — Roof Pitch {slider.val:.0f}°    |    "
-                     f"Wing room: {g['wall_x']:.1f}'    Post extension: {g['right_section']:.1f}'    "
-                     f"Total span: {g['horiz_span']:.1f}'",
-                     fontsize=13, fontweight='bold', y=0.98)
+    state = {'val': 20.0, 'draft_queued': False, 'drafted': False}
+    draft_timer = fig.canvas.new_timer(interval=DRAFT_MS)
+    draft_timer.single_shot = True
+    settle_timer = fig.canvas.new_timer(interval=SETTLE_MS)
+    settle_timer.single_shot = True
+
+    def render(draft):
+        g = compute_geometry(state['val'])
+        draw_cross_section(ax_cross, g, draft)
+        draw_floorplan(ax_floor, g, draft)
+        set_title(g)
         fig.canvas.draw_idle()
 
-    slider.on_changed(update)
+    def on_draft():
+        state['draft_queued'] = False
+        state['drafted'] = True
+        render(draft=True)
+
+    def on_settle():
+        was_queued = state['draft_queued']
+        if was_queued:
+            draft_timer.stop()
+            state['draft_queued'] = False
+        # Any draft on screen must be replaced, even if the pitch came back
+        # to where the last full-quality render was; a cancelled draft means
+        # the new pitch has not been drawn at all yet
+        if state['drafted'] or was_queued:
+            state['drafted'] = False
+            render(draft=False)
+
+    draft_timer.add_callback(on_draft)
+    settle_timer.add_callback(on_settle)
+
+    def update(val):
+        state['val'] = val
+        # Restart the settle countdown on every event (debounce)
+        settle_timer.stop()
+        settle_timer.start()
+        # Only one draft in flight; later events just update the pitch it draws
+        if not state['draft_queued']:
+            state['draft_queued'] = True
+            draft_timer.start()
 
-    # Initial title
-    fig.suptitle(f"Hippie Hideout — Roof Pitch 20°    |    "
-                 f"Wing room: {g['wall_x']:.1f}'    Post extension: {g['right_section']:.1f}'    "
-                 f"Total span: {g['horiz_span']:.1f}'",
-                 fontsize=13, fontweight='bold', y=0.98)
+    slider.on_changed(update)
 
     plt.show()
 
 
-def export_single(angle_deg, output_path=None):
-    """Export a single PNG with both views at the given angle."""
-    if output_path is None:
-        output_path = f'/Users/nathan.norman/hippie-hideout-{angle_deg:.0f}deg.png'
-
+def make_dual_figure():
+    """Create the side-by-side figure used for PNG exports."""
     fig, (ax_cross, ax_floor) = plt.subplots(1, 2, figsize=(22, 10))
     plt.subplots_adjust(wspace=0.25)
+    return fig, ax_cross, ax_floor
+
+
+def render_dual(fig, ax_cross, ax_floor, angle_deg, output_path=None, layout=True):
+    """Draw both views at the given angle into an existing figure and save it.
+
+    The figure is redrawn in place, so callers can keep one around and
+    reuse it across exports. The axes limits are fixed, so the layout does
+    not change with pitch; pass layout=False to keep the one from an
+    earlier call and skip the tight_layout pass.
+    """
+    if output_path is None:
+        output_path = f'/Users/nathan.norman/hippie-hideout-{angle_deg:.0f}deg.png'
 
     g = compute_geometry(angle_deg)
     draw_cross_section(ax_cross, g)
@@ -363,8 +462,16 @@ def export_single(angle_deg, output_path=None):
                  f"Total span: {g['horiz_span']:.1f}'",
                  fontsize=13, fontweight='bold')
 
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
-    plt.savefig(output_path, dpi=200, facecolor='white')
+    if layout:
+        fig.tight_layout(rect=[0, 0, 1, 0.96])
+    fig.savefig(output_path, dpi=200, facecolor='white')
+    return output_path
+
+
+def export_single(angle_deg, output_path=None):
+    """Export a single PNG with both views at the given angle."""
+    fig, ax_cross, ax_floor = make_dual_figure()
+    output_path = render_dual(fig, ax_cross, ax_floor, angle_deg, output_path)
     plt.close(fig)
     print(f"Saved dual view at {angle_deg:.0f}° to {output_path}")
 
@@ -373,6 +480,9 @@ if __name__ == '__main__':
     if '--angle' in sys.argv:
         idx = sys.argv.index('--angle')
         angle = float(sys.argv[idx + 1])
-        export_single(angle)
+        output = None
+        if '--out' in sys.argv:
+            output = sys.argv[sys.argv.index('--out') + 1]
+        export_single(angle, output)
     else:
         run_interactive()
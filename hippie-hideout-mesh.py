@@ -0,0 +1,361 @@
+#!/Users/nathan.norman/.pyenv/versions/3.10.14/bin/python3
+"""
+3D building mesh export (binary STL, OBJ, glTF) from the floor plan geometry.
+
+Builds the dome shell on its riser, both wings (20' back wall, side wall
+sloping 20' -> 8', 12' interior wall back to the dome, pitched roof with
+overhang) and the front entry from the same points draw_floorplan uses.
+Every part is a NumPy vertex buffer (float32, N x 3) plus a triangle index
+buffer (uint32, M x 3), in feet, Z up, dome centre at the origin.
+
+Parts whose inputs don't change with pitch (dome, riser, back walls, entry)
+are cached, so a pitch sweep only rebuilds the wing side walls, interior
+walls and roofs.
+
+Usage:
+    python3 hippie-hideout-mesh.py --angle 25                        # GLB to home dir
+    python3 hippie-hideout-mesh.py --angle 25 --out hideout.stl --units in
+    python3 hippie-hideout-mesh.py --sweep 20 35 2.5 --out sweep/hideout.obj
+"""
+
+import argparse
+import base64
+import functools
+import importlib.util
+import json
+import os
+import struct
+import time
+
+import numpy as np
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location(
+    'hideout', os.path.join(_here, 'hippie-hideout-interactive.py'))
+hideout = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(hideout)
+
+# --- Fixed dimensions (match view-elevations.html) ---
+RISER_H = hideout.RIGHT_POST_H  # 8' riser wall under the dome shell
+ENTRY_H = 8.0                   # entry box height
+ROOF_OVERHANG = 2.0             # roof overhang past the post (feet)
+WALL_T = 0.5                    # wall thickness (6")
+ROOF_T = 0.75                   # roof slab thickness (9")
+DOME_LAT = 24                   # dome shell rings, riser to crown
+DOME_LON = 64                   # segments around the dome
+
+UNIT_SCALE = {'ft': 1.0, 'in': 12.0, 'm': 0.3048}
+
+# Part name -> RGBA for glTF materials (colours from view-elevations.html)
+PART_COLORS = {
+    'dome': (0.83, 0.91, 0.94, 1.0),
+    'riser': (0.72, 0.69, 0.63, 1.0),
+    'walls': (0.72, 0.66, 0.53, 1.0),
+    'roof': (0.55, 0.45, 0.33, 1.0),
+    'entry': (0.78, 0.72, 0.60, 1.0),
+}
+
+
+# ===================================================================
+# Primitive builders
+# ===================================================================
+
+def _freeze(verts, faces):
+    """Return read-only float32/uint32 buffers, safe to share from a cache."""
+    verts = np.ascontiguousarray(verts, dtype=np.float32)
+    faces = np.ascontiguousarray(faces, dtype=np.uint32)
+    verts.setflags(write=False)
+    faces.setflags(write=False)
+    return verts, faces
+
+
+def merge(meshes):
+    """Concatenate (verts, faces) pairs into one mesh."""
+    meshes = list(meshes)
+    offsets = np.cumsum([0] + [len(v) for v, _ in meshes[:-1]])
+    verts = np.concatenate([v for v, _ in meshes])
+    faces = np.concatenate([f + np.uint32(o) for (_, f), o in zip(meshes, offsets)])
+    return verts, faces
+
+
+def mirror_x(mesh):
+    """Mirror a mesh across the y-axis (left wing from right), keeping outward winding."""
+    verts, faces = mesh
+    verts = verts * np.array([-1.0, 1.0, 1.0], dtype=np.float32)
+    return _freeze(verts, faces[:, ::-1])
+
+
+def prism(base, z_bottom, z_top):
+    """Closed prism over a convex plan polygon with per-corner bottom/top heights.
+
+    base is (k, 2); z_bottom and z_top are scalars or (k,) arrays, so sloped
+    wall tops and pitched roof slabs are both just prisms.
+    """
+    base = np.asarray(base, dtype=float)
+    k = len(base)
+    z_bottom = np.broadcast_to(np.asarray(z_bottom, dtype=float), (k,))
+    z_top = np.broadcast_to(np.asarray(z_top, dtype=float), (k,))
+
+    # Counter-clockwise in plan so faces wind outward
+    x, y = base[:, 0], base[:, 1]
+    if np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y) < 0:
+        base, z_bottom, z_top = base[::-1], z_bottom[::-1], z_top[::-1]
+
+    verts = np.vstack([np.column_stack([base, z_bottom]),
+                       np.column_stack([base, z_top])])
+    i = np.arange(k)
+    j = (i + 1) % k
+    fan = np.arange(1, k - 1)
+    faces = np.vstack([
+        np.column_stack([np.zeros(k - 2, int), fan + 1, fan]),              # bottom
+        np.column_stack([np.full(k - 2, k), k + fan, k + fan + 1]),         # top
+        np.column_stack([i, j, k + j]),                                     # sides
+        np.column_stack([i, k + j, k + i]),
+    ])
+    return _freeze(verts, faces)
+
+
+def wall(p1, p2, h1, h2, thickness=WALL_T):
+    """Wall of the given thickness centred on p1 -> p2, top sloping h1 -> h2."""
+    p1 = np.asarray(p1, dtype=float)
+    p2 = np.asarray(p2, dtype=float)
+    d = p2 - p1
+    n = np.array([-d[1], d[0]]) / np.hypot(*d) * (thickness / 2)
+    base = [p1 - n, p2 - n, p2 + n, p1 + n]
+    return prism(base, 0.0, [h1, h2, h2, h1])
+
+
+@functools.lru_cache(maxsize=None)
+def dome_shell(radius, base_z, n_lat=DOME_LAT, n_lon=DOME_LON):
+    """Hemispherical shell surface sitting on base_z, closed at the crown."""
+    lat = np.linspace(0, np.pi / 2, n_lat + 1)[:-1]
+    lon = np.linspace(0, 2 * np.pi, n_lon, endpoint=False)
+    ring_r = radius * np.cos(lat)[:, None]
+    verts = np.column_stack([
+        (ring_r * np.cos(lon)).ravel(),
+        (ring_r * np.sin(lon)).ravel(),
+        np.repeat(base_z + radius * np.sin(lat), n_lon),
+    ])
+    verts = np.vstack([verts, [0.0, 0.0, base_z + radius]])
+
+    a = (np.arange(n_lat - 1)[:, None] * n_lon + np.arange(n_lon)).ravel()
+    b = (np.arange(n_lat - 1)[:, None] * n_lon + (np.arange(n_lon) + 1) % n_lon).ravel()
+    top = (n_lat - 1) * n_lon
+    faces = np.vstack([
+        np.column_stack([a, b, b + n_lon]),
+        np.column_stack([a, b + n_lon, a + n_lon]),
+        np.column_stack([top + np.arange(n_lon), top + (np.arange(n_lon) + 1) % n_lon,
+                         np.full(n_lon, len(verts) - 1)]),
+    ])
+    return _freeze(verts, faces)
+
+
+@functools.lru_cache(maxsize=None)
+def riser(radius, height, n_lon=DOME_LON):
+    """Open cylindrical riser wall under the dome shell."""
+    lon = np.linspace(0, 2 * np.pi, n_lon, endpoint=False)
+    ring = np.column_stack([radius * np.cos(lon), radius * np.sin(lon)])
+    verts = np.vstack([np.column_stack([ring, np.zeros(n_lon)]),
+                       np.column_stack([ring, np.full(n_lon, height)])])
+    i = np.arange(n_lon)
+    j = (i + 1) % n_lon
+    faces = np.vstack([np.column_stack([i, j, n_lon + j]),
+                       np.column_stack([i, n_lon + j, n_lon + i])])
+    return _freeze(verts, faces)
+
+
+# ===================================================================
+# Building parts
+# ===================================================================
+
+@functools.lru_cache(maxsize=None)
+def _back_wall(p1, p2):
+    return wall(p1, p2, hideout.LEFT_WALL_H, hideout.LEFT_WALL_H)
+
+
+@functools.lru_cache(maxsize=None)
+def _entry(corners):
+    """Entry box: three walls (open to the dome) and a flat roof slab."""
+    left_int, right_int, right_bot, left_bot = (np.array(c) for c in corners)
+    walls = merge([wall(left_int, left_bot, ENTRY_H, ENTRY_H),
+                   wall(left_bot, right_bot, ENTRY_H, ENTRY_H),
+                   wall(right_bot, right_int, ENTRY_H, ENTRY_H)])
+    roof = prism([left_int, left_bot, right_bot, right_int], ENTRY_H, ENTRY_H + ROOF_T)
+    return _freeze(*merge([walls, roof]))
+
+
+def _key(*points):
+    """Hashable cache key for plan points."""
+    return tuple(tuple(float(c) for c in p) for p in points)
+
+
+def _wing_right(g, fp):
+    """Right-wing walls and roof; only the back wall is pitch-independent."""
+    P, wall_end, post_end = fp['P'], fp['wall_end'], fp['post_end']
+    wall2_dir = fp['wall2_dir']
+    tan_p = np.tan(g['pitch_rad'])
+
+    walls = [_back_wall(*_key(P, wall_end)),
+             wall(wall_end, post_end, hideout.LEFT_WALL_H, hideout.RIGHT_POST_H)]
+    if fp['wall3_end'] is not None:
+        walls.append(wall(fp['wall2_end'], fp['wall3_end'],
+                          hideout.INTERIOR_WALL_H, hideout.INTERIOR_WALL_H))
+
+    # Roof plane: 20' along the back wall, falling at the pitch along wall2_dir
+    eave = post_end + ROOF_OVERHANG * wall2_dir
+    corners = np.array([P, wall_end, eave, P + (eave - wall_end)])
+    run = (corners - P) @ wall2_dir
+    z = hideout.LEFT_WALL_H - run * tan_p
+    roof = prism(corners, z, z + ROOF_T / np.cos(g['pitch_rad']))
+    return _freeze(*merge(walls)), roof
+
+
+def build_parts(angle_deg):
+    """Build every part of the building at the given roof pitch.
+
+    Returns {part_name: (verts, faces)}, verts in feet, Z up.
+    """
+    g = hideout.compute_geometry(angle_deg)
+    fp = hideout.compute_floorplan(g)
+    walls_r, roof_r = _wing_right(g, fp)
+    return {
+        'dome': dome_shell(hideout.DOME_R, RISER_H),
+        'riser': riser(hideout.DOME_R, RISER_H),
+        'entry': _entry(_key(*fp['entry'])),
+        'wing_right_walls': walls_r,
+        'wing_right_roof': roof_r,
+        'wing_left_walls': mirror_x(walls_r),
+        'wing_left_roof': mirror_x(roof_r),
+    }
+
+
+# ===================================================================
+# Writers
+# ===================================================================
+
+def write_stl(path, parts, scale=1.0):
+    """Write all parts as one binary STL."""
+    verts, faces = merge(parts.values())
+    tri = verts[faces] * np.float32(scale)
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+    records = np.zeros(len(faces), dtype=[('normal', '<f4', 3), ('verts', '<f4', (3, 3)),
+                                          ('attr', '<u2')])
+    records['normal'] = normals
+    records['verts'] = tri
+    with open(path, 'wb') as f:
+        f.write(b'Hippie Hideout'.ljust(80, b' '))
+        f.write(struct.pack('<I', len(faces)))
+        records.tofile(f)
+
+
+def write_obj(path, parts, scale=1.0):
+    """Write an OBJ with one named object per part."""
+    offset = 1
+    with open(path, 'w') as f:
+        f.write('# Hippie Hideout\n')
+        for name, (verts, faces) in parts.items():
+            f.write(f'o {name}\n')
+            np.savetxt(f, verts * scale, fmt='v %.4f %.4f %.4f')
+            np.savetxt(f, faces + offset, fmt='f %d %d %d')
+            offset += len(verts)
+
+
+def _gltf_document(parts, scale):
+    """Build the glTF JSON and binary buffer (Y up, as glTF requires)."""
+    chunks = []
+    doc = {'asset': {'version': '2.0', 'generator': 'hippie-hideout-mesh.py'},
+           'scene': 0, 'scenes': [{'nodes': list(range(len(parts)))}],
+           'nodes': [], 'meshes': [], 'materials': [], 'accessors': [], 'bufferViews': []}
+    byte_offset = 0
+    for name, (verts, faces) in parts.items():
+        pos = np.ascontiguousarray((verts * scale)[:, [0, 2, 1]] * np.float32([1, 1, -1]),
+                                   dtype=np.float32)
+        idx = np.ascontiguousarray(faces, dtype=np.uint32)
+        for data, target in ((pos, 34962), (idx, 34963)):
+            blob = data.tobytes()
+            doc['bufferViews'].append({'buffer': 0, 'byteOffset': byte_offset,
+                                       'byteLength': len(blob), 'target': target})
+            chunks.append(blob)
+            byte_offset += len(blob)  # both float32 and uint32: stays 4-byte aligned
+        n_views = len(doc['bufferViews'])
+        doc['accessors'].append({'bufferView': n_views - 2, 'componentType': 5126,
+                                 'count': len(pos), 'type': 'VEC3',
+                                 'min': pos.min(axis=0).tolist(),
+                                 'max': pos.max(axis=0).tolist()})
+        doc['accessors'].append({'bufferView': n_views - 1, 'componentType': 5125,
+                                 'count': idx.size, 'type': 'SCALAR'})
+        color = next((c for k, c in PART_COLORS.items() if name.endswith(k)), (0.8, 0.8, 0.8, 1.0))
+        doc['materials'].append({'name': name, 'doubleSided': True,
+                                 'pbrMetallicRoughness': {'baseColorFactor': list(color),
+                                                          'metallicFactor': 0.0}})
+        i = len(doc['meshes'])
+        doc['meshes'].append({'name': name, 'primitives': [{
+            'attributes': {'POSITION': 2 * i}, 'indices': 2 * i + 1, 'material': i}]})
+        doc['nodes'].append({'name': name, 'mesh': i})
+    binary = b''.join(chunks)
+    doc['buffers'] = [{'byteLength': len(binary)}]
+    return doc, binary
+
+
+def write_gltf(path, parts, scale=1.0):
+    """Write glTF 2.0: binary .glb, or .gltf with the buffer embedded."""
+    doc, binary = _gltf_document(parts, scale)
+    if path.lower().endswith('.gltf'):
+        doc['buffers'][0]['uri'] = ('data:application/octet-stream;base64,' +
+                                    base64.b64encode(binary).decode('ascii'))
+        with open(path, 'w') as f:
+            json.dump(doc, f)
+        return
+
+    js = json.dumps(doc, separators=(',', ':')).encode()
+    js += b' ' * (-len(js) % 4)
+    binary += b'\0' * (-len(binary) % 4)
+    total = 12 + 8 + len(js) + 8 + len(binary)
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<4sII', b'glTF', 2, total))
+        f.write(struct.pack('<I4s', len(js), b'JSON'))
+        f.write(js)
+        f.write(struct.pack('<I4s', len(binary), b'BIN\0'))
+        f.write(binary)
+
+
+WRITERS = {'.stl': write_stl, '.obj': write_obj, '.glb': write_gltf, '.gltf': write_gltf}
+
+
+def export_mesh(angle_deg, output_path=None, units='ft'):
+    """Build the building at one pitch and write it; format from the extension."""
+    if output_path is None:
+        output_path = f'/Users/nathan.norman/hippie-hideout-{angle_deg:.0f}deg.glb'
+    ext = os.path.splitext(output_path)[1].lower()
+    if ext not in WRITERS:
+        raise ValueError(f"Unsupported mesh format '{ext}' (use {', '.join(WRITERS)})")
+
+    start = time.perf_counter()
+    parts = build_parts(angle_deg)
+    WRITERS[ext](output_path, parts, UNIT_SCALE[units])
+    ms = (time.perf_counter() - start) * 1000.0
+    n_tri = sum(len(f) for _, f in parts.values())
+    print(f"Saved {n_tri} triangles at {angle_deg:g}° to {output_path} ({ms:.1f} ms)")
+    return output_path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export the Hippie Hideout as a 3D mesh')
+    parser.add_argument('--angle', type=float, default=20.0, help='roof pitch in degrees')
+    parser.add_argument('--sweep', type=float, nargs=3, metavar=('START', 'STOP', 'STEP'),
+                        help='export one file per pitch, suffixed -<angle>deg')
+    parser.add_argument('--out', default=None, help='output path (.stl, .obj, .glb, .gltf)')
+    parser.add_argument('--units', choices=sorted(UNIT_SCALE), default='ft')
+    args = parser.parse_args()
+
+    if args.sweep:
+        start, stop, step = args.sweep
+        base, ext = os.path.splitext(args.out or '/Users/nathan.norman/hippie-hideout.glb')
+        os.makedirs(os.path.dirname(os.path.abspath(base)), exist_ok=True)
+        for angle in np.arange(start, stop + step / 2, step):
+            export_mesh(angle, f'{base}-{angle:g}deg{ext}', args.units)
+    else:
+        export_mesh(args.angle, args.out, args.units)
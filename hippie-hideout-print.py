@@ -0,0 +1,246 @@
+#!/Users/nathan.norman/.pyenv/versions/3.10.14/bin/python3
+"""
+Large-format print export of the floor plan at true architectural scale.
+
+The plan is laid out at the requested scale (default 1/4" = 1') and split into
+overlapping page tiles with registration marks. The plan is drawn once and its
+plot/text calls recorded with their world bounds; each tile gets its own small
+figure that replays only the calls reaching its window, and is written and
+closed before the next one is built, so per-tile work shrinks with the tile
+and peak memory does not grow with sheet size.
+
+The plan comes from draw_floorplan in hippie-hideout-interactive.py rather
+than hippie-hideout-floorplan.py: the latter is a top-level script with fixed
+dimensions that saves its own files on import, while draw_floorplan follows
+--angle and draws onto any axes it is given.
+
+Usage:
+    python3 hippie-hideout-print.py --angle 25                     # letter tiles, PDF
+    python3 hippie-hideout-print.py --angle 25 --page tabloid --landscape
+    python3 hippie-hideout-print.py --angle 25 --page arch-d --landscape   # one plotter sheet
+    python3 hippie-hideout-print.py --angle 25 --format png --dpi 300      # one PNG per tile
+"""
+
+import argparse
+import importlib.util
+import math
+import os
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import PdfPages
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location(
+    'hideout', os.path.join(_here, 'hippie-hideout-interactive.py'))
+hideout = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(hideout)
+
+# Portrait (width, height) in inches
+PAGE_SIZES = {
+    'letter': (8.5, 11.0),
+    'legal': (8.5, 14.0),
+    'tabloid': (11.0, 17.0),
+    'arch-c': (18.0, 24.0),
+    'arch-d': (24.0, 36.0),
+    'arch-e': (36.0, 48.0),
+}
+
+MARK_R_IN = 0.2        # registration mark radius on paper (inches)
+
+
+def parse_scale(text):
+    """Parse a scale as inches per foot: '1/4' -> 0.25, '0.125' -> 0.125."""
+    if '/' in text:
+        num, den = text.split('/', 1)
+        return float(num) / float(den)
+    return float(text)
+
+
+def record_plan(g):
+    """Draw the floor plan once and record its drawing calls.
+
+    Returns (xlim, ylim, calls): the world extent (feet) draw_floorplan frames,
+    and a list of (method, args, kwargs, bounds) for every ax.plot/ax.text
+    call, bounds being (x0, x1, y0, y1) of the artists it made.
+    """
+    ax = Figure().add_subplot()
+    calls = []
+
+    def recorder(name):
+        method = getattr(ax, name)
+
+        def record(*args, **kwargs):
+            result = method(*args, **kwargs)
+            if name == 'plot':
+                xy = np.concatenate([line.get_xydata() for line in result])
+            else:
+                xy = np.array([result.get_position()])
+            bounds = (xy[:, 0].min(), xy[:, 0].max(), xy[:, 1].min(), xy[:, 1].max())
+            calls.append((name, args, kwargs, bounds))
+            return result
+        return record
+
+    ax.plot = recorder('plot')
+    ax.text = recorder('text')
+    hideout.draw_floorplan(ax, g)
+    return ax.get_xlim(), ax.get_ylim(), calls
+
+
+def tile_layout(xlim, ylim, scale, printable, overlap):
+    """Split the world extent into overlapping tile windows.
+
+    Returns (rows, cols, windows, seams) where windows[(row, col)] is
+    (x0, x1, y0, y1) in feet, row 0 being the top strip of the plan, and
+    seams is (xs, ys): the mid-lines of every overlap strip, in feet.
+    """
+    pw_ft = printable[0] / scale
+    ph_ft = printable[1] / scale
+    ov_ft = overlap / scale
+    step_x = pw_ft - ov_ft
+    step_y = ph_ft - ov_ft
+    width = xlim[1] - xlim[0]
+    height = ylim[1] - ylim[0]
+    cols = max(1, math.ceil((width - ov_ft) / step_x))
+    rows = max(1, math.ceil((height - ov_ft) / step_y))
+
+    windows = {}
+    for row in range(rows):
+        y1 = ylim[1] - row * step_y
+        for col in range(cols):
+            x0 = xlim[0] + col * step_x
+            windows[(row, col)] = (x0, x0 + pw_ft, y1 - ph_ft, y1)
+    seams_x = xlim[0] + step_x * np.arange(1, cols) + ov_ft / 2
+    seams_y = ylim[1] - step_y * np.arange(1, rows) - ov_ft / 2
+    return rows, cols, windows, (seams_x, seams_y)
+
+
+def _replay_window(ax, calls, x0, x1, y0, y1, pad):
+    """Replay the recorded plan calls whose artists reach the tile window.
+
+    Labels are drawn unclipped by the plan, so the replayed ones are clipped
+    to the axes; otherwise labels near an edge print into the page margin.
+    """
+    for name, args, kwargs, (bx0, bx1, by0, by1) in calls:
+        if bx1 < x0 - pad or bx0 > x1 + pad or by1 < y0 - pad or by0 > y1 + pad:
+            continue
+        artist = getattr(ax, name)(*args, **kwargs)
+        if name == 'text':
+            artist.set_clip_on(True)
+
+
+def _draw_registration(ax, window, seams, scale):
+    """Crosshair-in-circle marks along the shared tile seams.
+
+    Marks sit on the mid-line of each overlap strip, so the same mark prints
+    on every sheet that shares the seam and the sheets can be pinned
+    together through it. With a single row (or column) of tiles the marks
+    sit on the tile's mid-line along the other axis.
+    """
+    x0, x1, y0, y1 = window
+    r = MARK_R_IN / scale
+    circ = np.linspace(0, 2 * np.pi, 40)
+    xs = seams[0] if len(seams[0]) else np.array([(x0 + x1) / 2])
+    ys = seams[1] if len(seams[1]) else np.array([(y0 + y1) / 2])
+    if not len(seams[0]) and not len(seams[1]):
+        return
+    for mx in xs[(xs > x0) & (xs < x1)]:
+        for my in ys[(ys > y0) & (ys < y1)]:
+            ax.plot(mx + r * np.cos(circ), my + r * np.sin(circ), 'k-', lw=0.6, zorder=10)
+            ax.plot([mx - 1.5 * r, mx + 1.5 * r], [my, my], 'k-', lw=0.6, zorder=10)
+            ax.plot([mx, mx], [my - 1.5 * r, my + 1.5 * r], 'k-', lw=0.6, zorder=10)
+
+
+def render_tile(g, calls, window, page, margin, scale, label, seams):
+    """Build a one-page figure for a single tile window."""
+    page_w, page_h = page
+    x0, x1, y0, y1 = window
+
+    fig = Figure(figsize=(page_w, page_h))
+    fig.patch.set_facecolor('white')
+    ax = fig.add_axes([margin / page_w, margin / page_h,
+                       1 - 2 * margin / page_w, 1 - 2 * margin / page_h])
+    hideout.setup_axes(ax, (x0, x1), (y0, y1), '')
+    _replay_window(ax, calls, x0, x1, y0, y1, pad=2.0)
+    _draw_registration(ax, window, seams, scale)
+
+    # Exact scale: the axes box is already printable-size, so no autoscaling
+    ax.set_xlim(x0, x1)
+    ax.set_ylim(y0, y1)
+    ax.set_aspect('equal', adjustable='box')
+    ax.set_title('')
+    ax.set_xlabel('')
+    ax.set_ylabel('')
+    ax.tick_params(labelsize=7)
+
+    fig.text(margin / page_w, 1 - 0.6 * margin / page_h,
+             f"Hippie Hideout — Floor Plan — {g['pitch_deg']:.0f}° pitch    "
+             f"Tile {label}    Scale {scale:g}\" = 1'",
+             fontsize=8, ha='left', va='center')
+    return fig
+
+
+def export_print(angle_deg, output_path=None, page='letter', landscape=False,
+                 scale=0.25, margin=0.5, overlap=0.5, fmt='pdf', dpi=200):
+    """Export the floor plan as scaled, overlapping page tiles."""
+    page_size = PAGE_SIZES[page]
+    if landscape:
+        page_size = (page_size[1], page_size[0])
+    printable = (page_size[0] - 2 * margin, page_size[1] - 2 * margin)
+    if overlap >= min(printable):
+        raise ValueError(f"Overlap {overlap}\" does not fit a {printable[0]}x{printable[1]}\" print area")
+
+    g = hideout.compute_geometry(angle_deg)
+    xlim, ylim, calls = record_plan(g)
+    rows, cols, windows, seams = tile_layout(xlim, ylim, scale, printable, overlap)
+
+    if output_path is None:
+        output_path = f'/Users/nathan.norman/hippie-hideout-print-{angle_deg:.0f}deg'
+    base, ext = os.path.splitext(output_path)
+    if ext.lower() in ('.pdf', '.png'):
+        output_path = base
+
+    def tiles():
+        for (row, col), window in sorted(windows.items()):
+            label = f"R{row + 1}C{col + 1}"
+            yield label, render_tile(g, calls, window, page_size, margin, scale,
+                                     label, seams)
+
+    written = []
+    if fmt == 'pdf':
+        path = f'{output_path}.pdf'
+        with PdfPages(path) as pdf:
+            for _, fig in tiles():
+                pdf.savefig(fig, facecolor='white')
+        written.append(path)
+    else:
+        for label, fig in tiles():
+            path = f'{output_path}-{label}.png'
+            fig.savefig(path, dpi=dpi, facecolor='white')
+            written.append(path)
+
+    print(f"Saved {rows}x{cols} tiles ({page}{' landscape' if landscape else ''}, "
+          f"{scale:g}\" = 1') at {angle_deg:.0f}° to {', '.join(written)}")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--angle', type=float, default=20.0, help='roof pitch in degrees')
+    parser.add_argument('--out', default=None, help='output path (no extension)')
+    parser.add_argument('--page', choices=sorted(PAGE_SIZES), default='letter')
+    parser.add_argument('--landscape', action='store_true')
+    parser.add_argument('--scale', type=parse_scale, default=0.25,
+                        help="inches per foot, e.g. 1/4 or 1/8 (default 1/4)")
+    parser.add_argument('--margin', type=float, default=0.5, help='page margin in inches')
+    parser.add_argument('--overlap', type=float, default=0.5, help='tile overlap in inches')
+    parser.add_argument('--format', choices=['pdf', 'png'], default='pdf')
+    parser.add_argument('--dpi', type=int, default=200, help='PNG resolution')
+    args = parser.parse_args()
+    export_print(args.angle, args.out, page=args.page, landscape=args.landscape,
+                 scale=args.scale, margin=args.margin, overlap=args.overlap,
+                 fmt=args.format, dpi=args.dpi)
+
+
+if __name__ == '__main__':
+    main()
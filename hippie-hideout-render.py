@@ -0,0 +1,96 @@
+#!/Users/nathan.norman/.pyenv/versions/3.10.14/bin/python3
+"""
+Thin client for the warm render daemon (hippie-hideout-daemon.py).
+
+Takes the same arguments as hippie-hideout-interactive.py, but hands PNG
+exports to the running daemon over its Unix socket instead of importing
+numpy and matplotlib itself. If no daemon is listening it falls back to
+rendering locally.
+
+Usage:
+    python3 hippie-hideout-render.py --angle 25                # Export via daemon
+    python3 hippie-hideout-render.py --angle 25 --out plan.png
+    python3 hippie-hideout-render.py                           # Interactive window (local)
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+
+SOCKET_ENV = 'HIPPIE_HIDEOUT_SOCK'
+
+
+def default_socket_path():
+    """Socket path shared by the daemon and client ($HIPPIE_HIDEOUT_SOCK wins)."""
+    return os.environ.get(SOCKET_ENV) or os.path.join(
+        tempfile.gettempdir(), f'hippie-hideout-{os.getuid()}.sock')
+
+
+def send_request(request, socket_path=None, timeout=60.0):
+    """Send one JSON request line to the daemon and return its JSON reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall(json.dumps(request).encode() + b'\n')
+        with sock.makefile('rb') as reply:
+            line = reply.readline()
+    if not line:
+        raise ConnectionError('daemon closed the connection without replying')
+    return json.loads(line)
+
+
+def ping(socket_path=None, timeout=1.0):
+    """True if a render daemon answers a liveness check, False if none is listening.
+
+    Raises socket.timeout if something accepts the connection but never replies.
+    """
+    try:
+        reply = send_request({'ping': True}, socket_path, timeout)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    return bool(reply.get('pong'))
+
+
+def _load_local():
+    import importlib.util
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        'hideout', os.path.join(here, 'hippie-hideout-interactive.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def export_single(angle_deg, output_path=None):
+    """Export a dual-view PNG through the daemon, or locally if it is down."""
+    if output_path is not None:
+        # The daemon has its own working directory
+        output_path = os.path.abspath(output_path)
+    try:
+        reply = send_request({'angle': angle_deg, 'output': output_path})
+    except (FileNotFoundError, ConnectionRefusedError):
+        print('Render daemon not running; rendering locally', file=sys.stderr)
+        _load_local().export_single(angle_deg, output_path)
+        return
+    except socket.timeout:
+        print('Render daemon not responding; rendering locally', file=sys.stderr)
+        _load_local().export_single(angle_deg, output_path)
+        return
+    if not reply.get('ok'):
+        sys.exit(f"Render daemon error: {reply.get('error')}")
+    print(f"Saved dual view at {angle_deg:.0f}° to {reply['path']} "
+          f"({reply['ms']:.0f} ms)")
+
+
+if __name__ == '__main__':
+    if '--angle' in sys.argv:
+        idx = sys.argv.index('--angle')
+        angle = float(sys.argv[idx + 1])
+        output = None
+        if '--out' in sys.argv:
+            output = sys.argv[sys.argv.index('--out') + 1]
+        export_single(angle, output)
+    else:
+        _load_local().run_interactive()